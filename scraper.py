@@ -0,0 +1,578 @@
+"""
+Autocomplete Scraper shared by the v1, v2 and v3 endpoints
+
+Usage: python -m scraper [--log-level LEVEL] v1 [v2 v3 ...]
+Several versions can be scraped concurrently; they share one HTTP session but each keeps its
+own query pool, token bucket, state and output files (log, names, stats, journals).
+
+Key Features and Insights:
+- API returns at most 10 (v1), 12 (v2) or 15 (v3) words per request.
+- Maximum word length is 10 characters.
+- Allowed characters differ per version (see CONFIGS below).
+- API does not include a "Retry-After" header, so our exponential backoff is used for 429 responses.
+- Average API response time is 40-60 ms, so our timeout of 10 seconds is ample.
+- At 40-60 ms per request, the MAX_WORKERS threads per version, each sending batches of up to
+  BATCH_SIZE concurrent queries, could issue thousands of requests per minute, so the token
+  bucket (not the thread count) is what bounds throughput.
+- Server limits of 100 (v1), 50 (v2) and 80 (v3) requests per minute are enforced via a token bucket.
+  The bucket halves its rate on a 429 (once per round of requests sent at that rate) and creeps
+  back up to the limit on success.
+- New names are appended to unique_names_<v>.journal as they are found; stats_<v>.txt is
+  rewritten every 100 API requests. The sorted unique_names_<v>.txt is written only at
+  shutdown, so after a crash it is stale and the names found so far are in the journal.
+- Proper handling of Ctrl+C using threading.Event for graceful shutdown.
+- Interrupted runs resume from the name and prefix journals; delete the *.journal files to start over.
+"""
+
+import argparse
+import requests
+import orjson
+import os
+import random
+import time
+import logging
+import threading
+import itertools
+from bisect import bisect_left
+from dataclasses import dataclass
+from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread, Lock
+from logging.handlers import QueueHandler, QueueListener
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote_plus
+
+# Records go through a queue to a listener thread that does the file I/O, so
+# workers never block on the log file. main() attaches one log file per version.
+log_queue = Queue()
+logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[QueueHandler(log_queue)])
+
+# Configuration constants based on our discovered API constraints.
+API_HOST = "http://35.200.185.69:8000"
+MAX_WORKERS = 3         # Use 3 worker threads per version for concurrent processing.
+MAX_RETRIES = 5         # Maximum retries for each request upon failure (e.g., 429 response)
+MAX_PREFIX_LENGTH = 10  # Maximum length of word/prefix as per API constraint (words are <=10 characters)
+RETRY_DELAY = 1         # Base delay in seconds after a 429 error (we use exponential backoff)
+BATCH_SIZE = 16         # Maximum prefixes a worker takes from the queue and queries at once.
+SHARDS = 16             # Lock stripes for the shared name and prefix sets (a power of two).
+
+@dataclass(frozen=True)
+class Config:
+    """API constraints discovered for one autocomplete endpoint version."""
+    version: str        # Endpoint version, also used as the suffix of every output file.
+    max_results: int    # Maximum count of words returned per request.
+    rate: int           # Requests allowed per minute.
+    alphabet: str       # Characters appended to a prefix when expanding it.
+    seeds: str          # Characters a word can begin with.
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+DIGITS = "0123456789"
+
+CONFIGS = {
+    # v1: lowercase letters only.
+    "v1": Config("v1", max_results=10, rate=100, alphabet=LETTERS, seeds=LETTERS),
+    # v2: lowercase letters and digits, anywhere in the word.
+    "v2": Config("v2", max_results=12, rate=50, alphabet=LETTERS + DIGITS, seeds=LETTERS + DIGITS),
+    # v3: also plus(+), minus(-), space(' ') and period('.'), but never at the start of a word.
+    "v3": Config("v3", max_results=15, rate=80, alphabet=LETTERS + DIGITS + "+- .", seeds=LETTERS + DIGITS),
+}
+
+# Reuse one keep-alive connection pool for every request to the API host
+# instead of opening a new TCP connection per request. Sized for every version's
+# query pool running a full batch at once.
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=BATCH_SIZE * len(CONFIGS), max_retries=0))
+SESSION.headers.update({'Accept': 'application/json', 'Connection': 'keep-alive'})
+
+stop_event = threading.Event()  # Signals threads of every version to stop (e.g., on Ctrl+C).
+
+def write_atomic(path, text):
+    """Write text to a temporary file and rename it over path, so readers never see a half-written file."""
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+def put_many(q, items):
+    """Put all items on an unbounded Queue under a single acquisition of its mutex."""
+    with q.mutex:
+        n = len(q.queue)
+        q.queue.extend(items)
+        added = len(q.queue) - n
+        if added:
+            q.unfinished_tasks += added
+            q.not_empty.notify(added)
+
+def clear_queue(q):
+    """Drop every item waiting on a Queue, marking each one done so join() still returns."""
+    with q.mutex:
+        q.unfinished_tasks -= len(q.queue)
+        q.queue.clear()
+        if q.unfinished_tasks == 0:
+            q.all_tasks_done.notify_all()
+
+class TokenBucket:
+    """
+    Adaptive token bucket to enforce a maximum number of requests per refill period. Tokens
+    accrue continuously, up to burst, at a rate that starts at capacity/refill_period:
+    every success raises it additively (never above that start) and a 429 halves it.
+    Any refill_period window allows at most burst - 1 requests above capacity, so the default
+    burst of 1 paces requests evenly and never exceeds the server's limit.
+    """
+    def __init__(self, capacity, refill_period, burst=1, log=logging):
+        self.burst = burst               # Maximum tokens the bucket can save up.
+        self.tokens = burst              # Current available tokens (fractional).
+        self.rate_max = capacity / refill_period  # Configured limit, in tokens per second.
+        self.rate_min = self.rate_max / 16        # Floor for repeated 429s.
+        self.rate_step = self.rate_max / 100      # Additive increase per success.
+        self.rate = self.rate_max        # Current tokens added per second.
+        self.last_refill = time.monotonic()
+        self.last_decrease = float('-inf')  # When on_throttle() last lowered the rate.
+        self.cond = threading.Condition()  # Waiters sleep on it; close() wakes them all.
+        self.closed = False
+        self.log = log
+
+    def _refill(self):
+        """Add the tokens accrued since the last refill; call with the condition held."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def consume(self):
+        """Take one token, waiting exactly until the next one accrues. Returns False once closed."""
+        with self.cond:
+            while not self.closed:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+                self.log.debug("Token bucket empty. Waiting %.2f seconds", wait)
+                # Releases the lock while waiting, so other threads can check the bucket meanwhile.
+                self.cond.wait(wait)
+            return False
+
+    def on_success(self):
+        """Additive increase after a successful request."""
+        if self.rate < self.rate_max:
+            with self.cond:
+                self._refill()
+                self.rate = min(self.rate_max, self.rate + self.rate_step)
+
+    def on_throttle(self, sent_at):
+        """
+        Multiplicative decrease after a 429 for a request sent at sent_at (time.monotonic());
+        the saved-up burst is dropped as well. A request sent before the last decrease was paced
+        at the old rate, so its 429 is already accounted for: at most one decrease per round.
+        """
+        with self.cond:
+            if sent_at < self.last_decrease:
+                return
+            self._refill()
+            self.last_decrease = self.last_refill
+            self.rate = rate = max(self.rate_min, self.rate / 2)
+            self.tokens = min(self.tokens, 0)
+        self.log.info("Throttled: rate lowered to %.1f requests per minute", rate * 60)
+
+    def close(self):
+        """Wake every waiting thread and make further consume() calls fail."""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+class ShardedSet:
+    """
+    Set split into shards keyed by hash, each with its own lock, so threads adding
+    different keys rarely wait on each other. Membership tests take no lock: a single
+    set lookup is atomic under the GIL.
+    """
+    def __init__(self, shards=SHARDS):
+        self.shards = [set() for _ in range(shards)]
+        self.locks = [Lock() for _ in range(shards)]
+        self.mask = shards - 1  # shards must be a power of two.
+
+    def add_new(self, items):
+        """Add items and return the ones that were not present yet, taking each shard's lock at most once."""
+        groups = [[] for _ in self.shards]
+        for item in items:
+            groups[hash(item) & self.mask].append(item)
+        fresh = []
+        for shard, lock, group in zip(self.shards, self.locks, groups):
+            if group:
+                with lock:
+                    new = set(group) - shard
+                    shard |= new
+                fresh.extend(new)
+        return fresh
+
+    def update(self, items):
+        self.add_new(items)
+
+    def __contains__(self, item):
+        return item in self.shards[hash(item) & self.mask]
+
+    def __len__(self):
+        return sum(map(len, self.shards))
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self.shards)
+
+class Scraper:
+    """Explores the prefixes of one API version with its own rate limit, state and output files."""
+    def __init__(self, cfg):
+        self.cfg = cfg
+        # Built once: only the URL-encoded prefix changes between requests.
+        self.query_url = f"{API_HOST}/{cfg.version}/autocomplete?query="
+        self.suffix = f"_{cfg.version}"
+        self.log = logging.getLogger(f"scraper.{cfg.version}")
+        # Sorted so the cutoff taken from a full result page can be located with bisect.
+        self.allowed_chars = tuple(sorted(cfg.alphabet))
+        # Rate limiting: the server allows cfg.rate requests per minute.
+        self.bucket = TokenBucket(capacity=cfg.rate, refill_period=60, log=self.log)
+        # Per-version pool for the workers' batches of API queries: its threads block in this
+        # version's bucket, so sharing them would let the slowest version stall the others.
+        self.query_pool = ThreadPoolExecutor(max_workers=BATCH_SIZE, thread_name_prefix=f"query-{cfg.version}")
+
+        # Shared resources for managing state across this version's threads.
+        self.all_names = ShardedSet()           # Stores unique names returned by the API.
+        self.seen_prefixes = ShardedSet()   # Prefixes already queued or queried; claimed when queued.
+        self.prefix_queue = Queue()      # Queue for dynamic prefix exploration.
+        self.request_counter = itertools.count(1)  # Numbers API requests; next() needs no lock under the GIL.
+        self.requests_sent = 0           # Number of the latest API request made.
+        self.names_journal = None        # Append-only journal of newly found names (opened in start).
+        self.io_lock = Lock()            # Serializes writes to the names journal.
+        self.prefix_journal = None       # Append-only journal of queued and explored prefixes (opened in start).
+        self.journal_queue = Queue()     # Prefix journal records waiting for the checkpoint thread to write them.
+        self.checkpoint_event = threading.Event()  # Set every 100 requests to wake the checkpoint thread.
+        self.threads = []
+        self.checkpointer = None
+
+    def save_progress(self):
+        """Save progress statistics to disk after every 100 requests (names are journaled as found)."""
+        try:
+            # Save statistics about progress.
+            write_atomic(f'stats{self.suffix}.txt',
+                         f"Total unique names: {len(self.all_names)}\n"
+                         f"Total requests sent: {self.requests_sent}\n")
+            self.log.info("Progress saved to stats file.")
+        except Exception as e:
+            self.log.error("Save error: %s", e)
+
+    def save_names(self):
+        """Write the sorted list of unique names to disk once, at shutdown."""
+        try:
+            write_atomic(f'unique_names{self.suffix}.txt', '\n'.join(sorted(self.all_names)))
+            self.log.info("Unique names saved.")
+        except Exception as e:
+            self.log.error("Save error: %s", e)
+
+    def query_api(self, prefix):
+        """
+        Query the autocomplete API with a given prefix.
+        Implements exponential backoff for 429 responses (since no Retry-After header is provided).
+        Returns None if the prefix could not be queried (retries exhausted or shutting down).
+        """
+        retries = 0
+        while retries <= MAX_RETRIES and not stop_event.is_set():
+            try:
+                # Ensure we don't exceed the rate limit; a closed bucket means we are shutting down.
+                if not self.bucket.consume():
+                    return None
+                self.requests_sent = n = next(self.request_counter)
+                # Hand the every-100-requests save to the checkpoint thread.
+                if n % 100 == 0:
+                    self.checkpoint_event.set()
+
+                # Make the GET request to the API with the prefix.
+                sent_at = time.monotonic()
+                response = SESSION.get(self.query_url + quote_plus(prefix), timeout=10)
+
+                if response.status_code == 429:
+                    # API hit rate limit: slow the bucket down, and since no Retry-After header is
+                    # given, back off exponentially with jitter so threads don't retry in lockstep.
+                    self.bucket.on_throttle(sent_at)
+                    delay = RETRY_DELAY * (2 ** retries) * random.uniform(0.8, 1.2)
+                    self.log.warning("429 on %s. Retry %d in %.2f seconds", prefix, retries, delay)
+                    stop_event.wait(delay)  # Cut short on shutdown; the loop then returns None.
+                    retries += 1
+                    continue
+
+                response.raise_for_status()
+                self.bucket.on_success()
+                # Return the list of suggestions; at most cfg.max_results words per request.
+                return orjson.loads(response.content).get('results', [])
+
+            except Exception as e:
+                self.log.error("Error on %s: %s", prefix, e)
+                if retries >= MAX_RETRIES:
+                    return None
+                retries += 1
+                stop_event.wait(0.5)  # Small delay before retrying.
+        return None
+
+    def worker(self):
+        """
+        Worker thread function:
+        - Retrieves a batch of prefixes from the queue.
+        - Queries the API for the whole batch concurrently and collects new names.
+        - If the API returns the maximum number of suggestions and the prefix is not too long,
+          new prefixes are generated by appending allowed characters.
+        """
+        while True:
+            # Block for the first prefix only, then take whatever else is already waiting.
+            # A None sentinel from stop_workers() tells this worker to exit; stop draining at
+            # it so every worker receives exactly one.
+            batch = [self.prefix_queue.get()]
+            while batch[-1] is not None and len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self.prefix_queue.get_nowait())
+                except Empty:
+                    break
+            stopping = batch[-1] is None
+            if stopping:
+                batch.pop()
+                self.prefix_queue.task_done()
+                if not batch:
+                    return
+
+            # Query the whole batch concurrently; the token bucket still paces every request.
+            results = list(self.query_pool.map(self.query_api, batch))
+
+            # If the API returns the maximum number of suggestions and the prefix is not too long,
+            # generate new prefixes by appending allowed characters.
+            new_prefixes = []
+            finished = []
+            for prefix, suggestions in zip(batch, results):
+                if suggestions is None:
+                    # The query failed or was interrupted; a resumed run will retry this prefix.
+                    continue
+                finished.append(prefix)
+                if len(suggestions) >= self.cfg.max_results and len(prefix) < MAX_PREFIX_LENGTH:
+                    # Results are the alphabetically first matches, so every name under a child
+                    # that sorts before the last result's next character was already returned.
+                    # Only children from that character onwards can still hold unseen names.
+                    last = max(suggestions)
+                    cutoff = last[len(prefix)] if len(last) > len(prefix) and last.startswith(prefix) else ''
+                    chars = self.allowed_chars[bisect_left(self.allowed_chars, cutoff):]
+                    new_prefixes.extend(map(prefix.__add__, chars))
+
+            # Only the per-shard difference and union against all_names run under a lock.
+            new_names = self.all_names.add_new(set().union(*filter(None, results)))
+            # Claim the children before queueing them, so no prefix is ever queued twice.
+            queued = self.seen_prefixes.add_new(new_prefixes)
+            put_many(self.prefix_queue, queued)
+            if new_names:
+                # Journal only the newly found names instead of rewriting the whole names file.
+                with self.io_lock:
+                    self.names_journal.write('\n'.join(new_names) + '\n')
+            # Children before their finished parents, so a resumed run never loses part of the frontier.
+            self.journal_queue.put(''.join([f"queued\t{p}\n" for p in queued] + [f"explored\t{p}\n" for p in finished]))
+
+            for _ in batch:
+                self.prefix_queue.task_done()
+            if self.log.isEnabledFor(logging.INFO):
+                self.log.info("Processed %d prefixes | New names: %d | Queue size: %d",
+                              len(batch), len(new_names), self.prefix_queue.qsize())
+            if stopping:
+                return
+
+    def checkpoint_worker(self):
+        """
+        Checkpoint thread: writes queued prefix journal records every second, and every 100
+        requests saves progress and fsyncs both journals.
+        """
+        while not stop_event.is_set():
+            if self.checkpoint_event.wait(1):
+                self.checkpoint_event.clear()
+                self.save_progress()
+                self.flush_prefix_journal(sync=True)
+            else:
+                self.flush_prefix_journal()
+
+    def flush_prefix_journal(self, sync=False):
+        """
+        Write the prefix records handed over by workers to the prefix journal. With sync, fsync
+        the names journal first and then the prefix journal, so a prefix is never durably marked
+        explored before the names it returned.
+        """
+        if sync:
+            with self.io_lock:
+                os.fsync(self.names_journal.fileno())
+        records = []
+        while True:
+            try:
+                records.append(self.journal_queue.get_nowait())
+            except Empty:
+                break
+        if records:
+            self.prefix_journal.write(''.join(records))
+            self.prefix_journal.flush()
+        if sync:
+            os.fsync(self.prefix_journal.fileno())
+
+    def load_journals(self):
+        """
+        Reload the names, prefixes and request count of an interrupted run so it can be resumed.
+        Returns the prefixes that were queued but never explored, or None if there is no previous run
+        (no prefix journal, or one without a single complete record).
+        """
+        if not os.path.exists(f'prefixes{self.suffix}.journal'):
+            return None
+        queued = {}  # Insertion-ordered, so the resumed queue keeps BFS order.
+        explored = []
+        # A crash can leave a partial last line, so only lines ending in a newline are trusted.
+        with open(f'prefixes{self.suffix}.journal') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    break
+                kind, _, prefix = line[:-1].partition('\t')
+                if kind == 'explored':
+                    explored.append(prefix)
+                else:
+                    queued[prefix] = None
+        if not queued:
+            # Not even the seeds were recorded: the previous run died before doing any work.
+            return None
+        if os.path.exists(f'unique_names{self.suffix}.journal'):
+            with open(f'unique_names{self.suffix}.journal') as f:
+                self.all_names.update(line[:-1] for line in f if line.endswith('\n') and line != '\n')
+        # Carry the request count over so the stats stay cumulative. The stats file can lag the
+        # journal by up to 99 requests after a crash; every explored prefix took at least one.
+        sent = len(explored)
+        if os.path.exists(f'stats{self.suffix}.txt'):
+            with open(f'stats{self.suffix}.txt') as f:
+                for line in f:
+                    if line.startswith("Total requests sent: "):
+                        sent = max(sent, int(line.rsplit(' ', 1)[1]))
+        self.requests_sent = sent
+        self.request_counter = itertools.count(sent + 1)
+        self.seen_prefixes.update(explored)
+        return [p for p in queued if p not in self.seen_prefixes]
+
+    def start(self):
+        """Seed the prefix queue (or resume an interrupted run) and start this version's threads."""
+        pending = self.load_journals()
+        self.names_journal = open(f'unique_names{self.suffix}.journal', 'a', buffering=1)
+        self.prefix_journal = open(f'prefixes{self.suffix}.journal', 'a')
+        if pending is None:
+            # Initialize the prefix queue with every character a word can begin with.
+            pending = self.cfg.seeds
+            # Journal the seeds before any thread starts, so the journal never exists without them.
+            self.prefix_journal.write(''.join(f"queued\t{c}\n" for c in pending))
+            self.prefix_journal.flush()
+            os.fsync(self.prefix_journal.fileno())
+        else:
+            self.log.info("Resuming: %d names known, %d requests already sent, %d prefixes pending.",
+                          len(self.all_names), self.requests_sent, len(pending))
+        self.seen_prefixes.update(pending)
+        put_many(self.prefix_queue, pending)
+
+        # Start worker threads for concurrent processing.
+        for _ in range(MAX_WORKERS):
+            t = Thread(target=self.worker)
+            t.start()
+            self.threads.append(t)
+        self.checkpointer = Thread(target=self.checkpoint_worker)
+        self.checkpointer.start()
+
+    def stop_workers(self):
+        """
+        Send one None sentinel per worker thread and wait for the workers to exit, so nothing
+        touches the shared state or the journals once finish() runs.
+        """
+        for _ in self.threads:
+            self.prefix_queue.put(None)
+        for t in self.threads:
+            t.join()
+        self.query_pool.shutdown()  # Idle by now: each worker waited for its batch's queries.
+
+    def drain(self):
+        """Drop every queued prefix so the workers can finish gracefully."""
+        clear_queue(self.prefix_queue)
+
+    def finish(self, start_time):
+        """Wait for the checkpoint thread, then save final progress and report statistics."""
+        self.checkpointer.join()
+        self.flush_prefix_journal(sync=True)
+        self.requests_sent = next(self.request_counter) - 1  # Exact count now that workers have stopped.
+        self.save_progress()  # Final progress save.
+        self.save_names()     # Final sorted names file.
+        self.names_journal.close()
+        self.prefix_journal.close()
+        elapsed_time = time.time() - start_time
+        # Log final statistics.
+        self.log.info("Final progress saved.")
+        self.log.info("Total names extracted: %d", len(self.all_names))
+        self.log.info("Total API requests made: %d", self.requests_sent)
+        self.log.info("Total execution time: %.2f seconds", elapsed_time)
+        # Print summary details.
+        print(f"[{self.cfg.version}] Total new names extracted: {len(self.all_names)}")
+        print(f"[{self.cfg.version}] Total API requests sent: {self.requests_sent}")
+        print(f"[{self.cfg.version}] Total execution time: {elapsed_time:.2f} seconds")
+
+def version_log_handler(version):
+    """Log file handler for one version: receives that version's records plus any shared ones."""
+    name = f"scraper.{version}"
+    handler = logging.FileHandler(f'autocomplete_extraction_{version}.log')
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    handler.addFilter(lambda record: record.name == name or not record.name.startswith('scraper.'))
+    return handler
+
+def main(versions):
+    """
+    Main function:
+    - Starts one Scraper per requested API version (seeded, or resumed from its journals).
+    - Waits until the prefix queues are fully processed and handles graceful shutdown on KeyboardInterrupt.
+    - Saves final progress and prints summary statistics upon completion.
+    """
+    start_time = time.time()
+    versions = list(dict.fromkeys(versions))  # Each version runs at most once.
+    log_listener = QueueListener(log_queue, *(version_log_handler(v) for v in versions))
+    log_listener.start()
+    scrapers = [Scraper(CONFIGS[v]) for v in versions]
+    for s in scrapers:
+        s.start()
+
+    # Queue.join() returns once task_done() has matched every put(), i.e. once no prefix is
+    # queued or still being processed. Run it off the main thread, which waits in 1-second
+    # slices: on Windows an untimed wait cannot be interrupted by Ctrl+C.
+    all_done = threading.Event()
+    def wait_for_queues():
+        for s in scrapers:
+            s.prefix_queue.join()
+        all_done.set()
+    Thread(target=wait_for_queues, daemon=True).start()
+
+    try:
+        while not all_done.wait(1):
+            pass
+        logging.info("Queue empty. No more prefixes to process.")
+    except KeyboardInterrupt:
+        logging.info("KeyboardInterrupt detected. Shutting down...")
+        stop_event.set()
+        for s in scrapers:
+            s.bucket.close()  # Release threads waiting for a token.
+        # Drain the queues to allow workers to finish gracefully.
+        for s in scrapers:
+            s.drain()
+    finally:
+        # Make in-flight queries give up (no new tokens, no retry waits), then wait for every
+        # worker to finish its batch before the final save.
+        stop_event.set()
+        for s in scrapers:
+            s.bucket.close()
+        for s in scrapers:
+            s.stop_workers()
+        SESSION.close()
+        for s in scrapers:
+            s.finish(start_time)
+        log_listener.stop()  # Flushes any records still queued.
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract every name behind the autocomplete API.")
+    parser.add_argument("versions", nargs="+", choices=sorted(CONFIGS), help="API versions to scrape concurrently")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="minimum level written to the log files (WARNING skips per-batch progress lines)")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(args.log_level)
+    main(args.versions)